@@ -249,18 +249,27 @@ class PolyDBCollection:
                                               "Polynomial",
                                               "SparseMatrix"]
 
-    def build_polymake_type(self, type: dict = None) -> str:
-        item = type.pop(0)
+    def build_polymake_type(self, type: list = None) -> str:
+        """
+        Build a polymake type name from the list of its components
+
+        :param type: the components of the type in prefix order, e.g. ['Matrix', 'Rational', 'NonSymmetric']
+        :return: the polymake type name, e.g. 'Matrix<Rational,NonSymmetric>'
+        """
+        return self._build_polymake_type(iter(type))
+
+    def _build_polymake_type(self, type) -> str:
+        item = next(type)
         typedef = item
         if item in self.polymake_templated_types_one_argument:
             typedef += "<"
-            typedef += self.build_polymake_type(type)
+            typedef += self._build_polymake_type(type)
             typedef += ">"
         elif item in self.polymake_templated_types_two_arguments:
             typedef += "<"
-            typedef += self.build_polymake_type(type)
+            typedef += self._build_polymake_type(type)
             typedef += ","
-            typedef += self.build_polymake_type(type)
+            typedef += self._build_polymake_type(type)
             typedef += ">"
 
         return typedef
@@ -279,6 +288,6 @@ class PolyDBCollection:
         else:
             typedef = "polymake::"
             type = path[2].split("-")
-            typedef += type.pop(0) + "::"
-            typedef += self.build_polymake_type(type)
+            typedef += type[0] + "::"
+            typedef += self.build_polymake_type(type[1:])
         return typedef
@@ -2,15 +2,21 @@ from .utilities import _sanitize_result
 
 
 class PolyDBCursor:
+    """
+    A wrapper for a cursor returned by a query to PolyDB
+
+    A cursor is not thread-safe. Each thread should obtain its own cursor
+    by running its own query instead of sharing one between threads.
+    """
 
     def __init__(self, cur):
         self._cursor = cur
 
     def next(self):
-        try:
-            return self._cursor.next()
-        except StopIteration:
-            return False
+        """
+        Return the next document, or False if the cursor is exhausted
+        """
+        return next(self, False)
 
     def __iter__(self):
         return self
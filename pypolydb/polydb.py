@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from pymongo import MongoClient
 from pymongo import errors
 import re
@@ -16,6 +17,12 @@ class polyDB:
     :param port: port
     :param use_ssl: use TLS
     :return: a polyDB instance
+
+    A polyDB instance can be shared between threads. All threads use the
+    connection pool of the underlying MongoClient, whose size can be set
+    with the maxPoolSize keyword argument. Cursors must not be shared,
+    each thread should run its own query. Use map_queries to run many
+    independent queries concurrently.
     """
 
     def __init__(self, username='polymake',
@@ -107,6 +114,45 @@ class polyDB:
         """
         return PolyDBCollection(self._db, collectionname)
 
+    def _run_query(self, query: dict):
+        """
+        Run a single query as described in map_queries
+
+        :param query: the query description
+        :return: the list of documents for find, the number of documents for count
+        """
+        kwargs = dict(query)
+        collection = self.get_collection(kwargs.pop('collection'))
+        method = kwargs.pop('method', 'find')
+        if method == 'find':
+            return list(collection.find(**kwargs))
+        if method == 'count':
+            if set(kwargs) - {'filter'}:
+                raise ValueError("count queries only accept a filter, got: " + ", ".join(sorted(kwargs)))
+            return collection.count(**kwargs)
+        raise ValueError("unknown query method: " + str(method))
+
+    def map_queries(self, queries: list, max_workers: int | None = None) -> list:
+        """
+        Run independent queries concurrently over the shared connection pool
+
+        Each query is a dictionary with the name of the collection under 'collection',
+        the method under 'method' (either 'find', the default, or 'count'),
+        and the remaining entries passed as arguments to that method, e.g.
+        {'collection': 'Polytopes.Lattice.SmoothReflexive', 'method': 'count', 'filter': {'DIM': 3}}
+        A count query may only contain a 'filter', other arguments raise a ValueError.
+
+        :param queries: a list of query dictionaries
+        :param max_workers: the number of threads, defaults to the size of the connection pool,
+            or to 32 if the pool is unbounded (maxPoolSize=0)
+        :return: a list with the result of each query, in the order of the queries
+        """
+        if max_workers is None:
+            max_workers = self._client.options.pool_options.max_pool_size or 32
+        max_workers = max(1, min(max_workers, len(queries)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._run_query, queries))
+
     def section_info(self, section: str = None) -> list:
         """
         Returns information about a section
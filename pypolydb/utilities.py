@@ -2,6 +2,11 @@ __all__ = ['_sanitize_result']
 
 
 def _sanitize_result(obj: dict) -> dict:
+    """
+    Return the document without the internal '_attrs' entry
+
+    The document passed in is not modified, so results may be shared between threads.
+    """
     if isinstance(obj, dict) and '_attrs' in obj:
-        del obj['_attrs']
+        return {k: v for k, v in obj.items() if k != '_attrs'}
     return obj
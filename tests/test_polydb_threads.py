@@ -0,0 +1,114 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from pypolydb import polydb
+from pypolydb.PolyDBCollection import PolyDBCollection
+from pypolydb.utilities import _sanitize_result
+
+N_THREADS = 32
+
+
+def test_sanitize_result_does_not_mutate():
+    doc = {'_id': 'F.3D.0008', '_attrs': {'a': 1}}
+    result = _sanitize_result(doc)
+    assert '_attrs' not in result
+    assert '_attrs' in doc
+
+
+def test_build_polymake_type_does_not_mutate():
+    coll = PolyDBCollection(None)
+    type = ['Matrix', 'Rational', 'NonSymmetric']
+    assert coll.build_polymake_type(type) == 'Matrix<Rational,NonSymmetric>'
+    assert type == ['Matrix', 'Rational', 'NonSymmetric']
+
+
+def test_shared_collection():
+    pdb = polydb.polyDB(maxPoolSize=N_THREADS)
+    coll = pdb.get_collection('Polytopes.Lattice.SmoothReflexive')
+    filter = {'N_VERTICES': 10}
+
+    def run(i):
+        return coll.find(skip=3, limit=1, filter=filter).next()['_id'], coll.count(filter=filter)
+
+    with ThreadPoolExecutor(max_workers=N_THREADS) as executor:
+        results = list(executor.map(run, range(4 * N_THREADS)))
+    assert results == [('F.3D.0008', 11)] * (4 * N_THREADS)
+
+
+def test_map_queries():
+    pdb = polydb.polyDB(maxPoolSize=N_THREADS)
+    name = 'Polytopes.Lattice.SmoothReflexive'
+    filter = {'N_VERTICES': 10}
+    queries = [{'collection': name, 'method': 'count', 'filter': filter},
+               {'collection': name, 'filter': filter, 'skip': 3, 'limit': 1}] * N_THREADS
+    results = pdb.map_queries(queries)
+    assert len(results) == 2 * N_THREADS
+    for c, docs in zip(results[::2], results[1::2]):
+        assert c == 11
+        assert [d['_id'] for d in docs] == ['F.3D.0008']
+
+
+def _in_flight(pdb, queries, max_workers=None):
+    """
+    Run map_queries and record the largest number of queries running at the same time
+    """
+    run_query = pdb._run_query
+    lock = threading.Lock()
+    state = {'current': 0, 'max': 0}
+
+    def counting_run_query(query):
+        with lock:
+            state['current'] += 1
+            state['max'] = max(state['max'], state['current'])
+        try:
+            # keep every query in flight long enough for concurrent ones to overlap
+            time.sleep(0.05)
+            return run_query(query)
+        finally:
+            with lock:
+                state['current'] -= 1
+
+    pdb._run_query = counting_run_query
+    try:
+        start = time.perf_counter()
+        results = pdb.map_queries(queries, max_workers=max_workers)
+        elapsed = time.perf_counter() - start
+    finally:
+        del pdb._run_query
+    return results, state['max'], elapsed
+
+
+def test_map_queries_concurrent():
+    pdb = polydb.polyDB(maxPoolSize=N_THREADS)
+    queries = [{'collection': 'Polytopes.Lattice.SmoothReflexive', 'method': 'count',
+                'filter': {'N_VERTICES': 10}}] * N_THREADS
+
+    serial_results, serial_in_flight, serial_time = _in_flight(pdb, queries, max_workers=1)
+    results, in_flight, elapsed = _in_flight(pdb, queries)
+
+    assert results == serial_results
+    assert serial_in_flight == 1
+    assert in_flight > 1
+    assert elapsed < serial_time / 2
+
+
+def test_map_queries_rejects_count_arguments():
+    pdb = polydb.polyDB()
+    with pytest.raises(ValueError):
+        pdb.map_queries([{'collection': 'Polytopes.Lattice.SmoothReflexive', 'method': 'count', 'limit': 5}])
+
+
+def test_answer():
+    test_sanitize_result_does_not_mutate()
+    test_build_polymake_type_does_not_mutate()
+    test_shared_collection()
+    test_map_queries()
+    test_map_queries_concurrent()
+    test_map_queries_rejects_count_arguments()